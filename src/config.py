@@ -16,29 +16,39 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import copy
+import functools
 import os
+from types import MappingProxyType
+
+@functools.cache
+def _abs(path):
+    """os.path.abspath, skipping the getcwd() call when 'path' is already absolute."""
+    return path if os.path.isabs(path) else os.path.abspath(path)
 
 # File paths and template settings
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))   # base path
-DATA_FOLDER = os.path.join(BASE_DIR, "..", "data")
-
-TEMPLATE_FOLDER = os.path.join(DATA_FOLDER, "templates")
-TEMPLATE_HTML_FILE = os.path.join(TEMPLATE_FOLDER, "template.html")
-HTML_REPORT_FOLDER = os.path.join(DATA_FOLDER, "html_reports")
-CSV_REPORT_FOLDER = os.path.join(DATA_FOLDER, "csv_reports")
-JSON_REPORT_FOLDER = os.path.join(DATA_FOLDER, "json_reports")
-CONFIG_FOLDER = os.path.join(DATA_FOLDER, "config")
-SETTINGS_YAML = os.path.join(CONFIG_FOLDER, "settings.yaml")
-RSS_SOURCES = os.path.join(DATA_FOLDER, "rss_sources")
-OPML_FILENAME = os.path.join(RSS_SOURCES, "cybersecnews-sources.opml")
-CACHE_FOLDER = os.path.join(DATA_FOLDER, "cache")
-
-TEMPLATE_HTML_FILE = os.path.abspath(TEMPLATE_HTML_FILE)
-HTML_REPORT_FOLDER = os.path.abspath(HTML_REPORT_FOLDER)
-CSV_REPORT_FOLDER = os.path.abspath(CSV_REPORT_FOLDER)
-JSON_REPORT_FOLDER = os.path.abspath(JSON_REPORT_FOLDER)
-OPML_FILENAME = os.path.abspath(OPML_FILENAME)
-SETTINGS_YAML = os.path.abspath(SETTINGS_YAML)
+BASE_DIR = os.path.dirname(_abs(__file__))   # base path
+
+# The parts below are plain relative names, so on POSIX a separator join is enough
+_join = os.sep.join if os.sep == "/" else lambda parts: os.path.join(*parts)
+
+@functools.cache
+def _resolve(*parts):
+    """Join 'parts' onto BASE_DIR and normalise the result in a single pass."""
+    return os.path.normpath(_join((BASE_DIR, *parts)))
+
+DATA_FOLDER = _resolve("..", "data")
+
+TEMPLATE_FOLDER = _resolve("..", "data", "templates")
+TEMPLATE_HTML_FILE = _resolve("..", "data", "templates", "template.html")
+HTML_REPORT_FOLDER = _resolve("..", "data", "html_reports")
+CSV_REPORT_FOLDER = _resolve("..", "data", "csv_reports")
+JSON_REPORT_FOLDER = _resolve("..", "data", "json_reports")
+CONFIG_FOLDER = _resolve("..", "data", "config")
+SETTINGS_YAML = _resolve("..", "data", "config", "settings.yaml")
+RSS_SOURCES = _resolve("..", "data", "rss_sources")
+OPML_FILENAME = _resolve("..", "data", "rss_sources", "cybersecnews-sources.opml")
+CACHE_FOLDER = _resolve("..", "data", "cache")
 
 # Default start and end offsets (in days) relative to today
 DEFAULT_START = 1
@@ -60,7 +70,13 @@ MAX_LENGTH_SKIPPED_REASON = 500
 FEED_SEPARATOR = "-" * 40
 MAX_FEEDTITLE_LEN_PRINT = 40
 MAX_CONCURRENT_TASKS = 15
+MAX_ALLOWED_CONCURRENT_TASKS = 100
 CACHE_MAX_AGE_SECONDS = 600  # 10 minutes
+# Adaptive refresh: a cached feed is reused for this fraction of its usual gap between new entries
+ADAPTIVE_REFRESH_FACTOR = 0.5
+ADAPTIVE_REFRESH_MAX_SECONDS = 6 * 3600
+ADAPTIVE_REFRESH_ALPHA = 0.3  # EWMA weight of the newest observed gap
+OPML_CACHE_FILENAME = ".opml_cache.json"
 STALE_DAYS_THRESHOLD = 30
 PRINT_RSS_PROCESSING_STATUS = False
 SINGLE_FEED_CHECK = None
@@ -73,23 +89,30 @@ DEFAULT_REQUEST_HEADERS = {
     'Referer': 'https://www.google.com',
 }
 HTTP_REQUEST_TIMEOUT = 10  # seconds
+HTTP_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL_SECONDS = 300
+OUTPUT_BUFFER_SIZE = 1 << 20  # bytes, write buffer for report files
 
-EXCLUDE_KEYWORDS = [
+DEFAULT_EXCLUDE_KEYWORDS = (
     'sponsored',
     'advertisement',
     'giveaway',
     'clickbait',
     'advertorial',
     'paid content'
-]
+)
 
-KEYWORD_EXCEPTIONS = {
-    'sponsored': ['state-sponsored']
-}
+KEYWORD_EXCEPTIONS = MappingProxyType({
+    'sponsored': frozenset({'state-sponsored'})
+})
 
-CYBERSECURITY_KEYWORDS = {
+CYBERSECURITY_KEYWORDS = frozenset({
     'security'
-}
+})
+
+# Lower-cased once at import, for matching against lower-cased article text
+DEFAULT_EXCLUDE_KEYWORDS_LC = tuple(kw.lower() for kw in DEFAULT_EXCLUDE_KEYWORDS)
+CYBERSECURITY_KEYWORDS_LC = tuple(sorted(kw.lower() for kw in CYBERSECURITY_KEYWORDS))
 
 #default options for args
 PRINT_RETRIEVED = False
@@ -99,13 +122,15 @@ ORDER_BY = "date"
 OUTPUT_FORMAT = "html"
 ALIGN_START_TO_MIDNIGHT = False
 ALIGN_END_TO_MIDNIGHT = False
-EXCLUDE_KEYWORDS = False
+EXCLUDE_KEYWORDS_ENABLED = False
 EXCLUDE_KEYWORDS_FILE = None
 AGGRESSIVE_FILTERING = False
 AGGRESSIVE_KEYWORDS_FILE = None
 HTML_IMG = False
 IGNORE_CACHE = False
 NO_CONDITIONAL_CACHE = True
+ADAPTIVE_REFRESH = False
+FORCE_REFRESH = False
 
 # Keys used in RSS feed entries
 SUMMARY_KEY = "summary"
@@ -143,6 +168,8 @@ TEXT_DATE_FORMAT_PRINT = "%A, %d %B %Y %H:%M"
 TEXT_DATE_FORMAT_PRINT_SHORT = "%d %b %Y %H:%M"
 
 class UserOption:
+    __slots__ = ('macro_name', 'default', 'value', 'yaml_name', 'cli_name', 'cli_only', 'yaml_only')
+
     def __init__(self, macro_name, default, yaml_name, cli_name, cli_only=False, yaml_only=False):
         self.macro_name = macro_name      # e.g., OUTPUT_HTML_FOLDER
         self.default = default            # original default
@@ -160,38 +187,61 @@ class UserOption:
         self.value = self.default
 
 
-def build_user_options():
-    """Return a fresh dictionary of all configurable UserOption objects."""
-    # Each UserOption contains:
-    #   - macro_name: the internal constant/macro name used in code (e.g., OUTPUT_HTML_FOLDER)
-    #   - value: the current active value (default unless overridden by YAML or CLI)
-    #   - yaml_name: the key used in YAML configuration files
-    #   - cli_name: the command-line flag name used when running the program (e.g., --output-html-folder)
-
-    return {
-        "DEFAULT_START": UserOption("DEFAULT_START", DEFAULT_START, "start", "start"),
-        "DEFAULT_END": UserOption("DEFAULT_END", DEFAULT_END, "end", "end"),
-        "OPML_FILENAME": UserOption("OPML_FILENAME", OPML_FILENAME, "opml_filename", "opml-filename"),
-        "OUTPUT_FORMAT": UserOption("OUTPUT_FORMAT", OUTPUT_FORMAT, "output_format", "output-format"),
-        "HTML_REPORT_FOLDER": UserOption("HTML_REPORT_FOLDER", HTML_REPORT_FOLDER, "output_html_folder", "output-html-folder"),
-        "CSV_REPORT_FOLDER": UserOption("CSV_REPORT_FOLDER", CSV_REPORT_FOLDER, "output_csv_folder", "output-csv-folder"),
-        "JSON_REPORT_FOLDER": UserOption("JSON_REPORT_FOLDER", JSON_REPORT_FOLDER, "output_json_folder", "output-json-folder"),
-        "ALIGN_START_TO_MIDNIGHT": UserOption("ALIGN_START_TO_MIDNIGHT", ALIGN_START_TO_MIDNIGHT, "align_start_to_midnight", "align-start-to-midnight"),
-        "ALIGN_END_TO_MIDNIGHT": UserOption("ALIGN_END_TO_MIDNIGHT", ALIGN_END_TO_MIDNIGHT, "align_end_to_midnight", "align-end-to-midnight"),
-        "HTML_IMG": UserOption("HTML_IMG", HTML_IMG, "html_img", "html-img"),
-        "MAX_LENGTH_DESCRIPTION": UserOption("MAX_LENGTH_DESCRIPTION", MAX_LENGTH_DESCRIPTION, "max_length_description", "max-length-description"),
-        "EXCLUDE_KEYWORDS": UserOption("EXCLUDE_KEYWORDS", EXCLUDE_KEYWORDS, "exclude_keywords", "exclude-keywords"),
-        "EXCLUDE_KEYWORDS_FILE": UserOption("EXCLUDE_KEYWORDS_FILE", EXCLUDE_KEYWORDS_FILE, "exclude_keywords_file", "exclude-keywords-file"),
-        "AGGRESSIVE_FILTERING": UserOption("AGGRESSIVE_FILTERING", AGGRESSIVE_FILTERING, "aggressive_filtering", "aggressive-filtering"),
-        "AGGRESSIVE_KEYWORDS_FILE": UserOption("AGGRESSIVE_KEYWORDS_FILE", AGGRESSIVE_KEYWORDS_FILE, "aggressive_keywords_file", "aggressive-keywords-file"),
-        "PRINT_RETRIEVED": UserOption("PRINT_RETRIEVED", PRINT_RETRIEVED, "print_retrieved", "print-retrieved"),
-        "PRINT_SKIPPED": UserOption("PRINT_SKIPPED", PRINT_SKIPPED, "print_skipped", "print-skipped"),
-        "ORDER_BY": UserOption("ORDER_BY", ORDER_BY, "order_by", "order-by"),
-        "IGNORE_CACHE": UserOption("IGNORE_CACHE", IGNORE_CACHE, "ignore_cache", "ignore-cache"),
-        "NO_CONDITIONAL_CACHE": UserOption("NO_CONDITIONAL_CACHE", NO_CONDITIONAL_CACHE, "no_conditional_cache", "no-conditional-cache"),
-        "CHECK_FEEDS": UserOption("CHECK_FEEDS", CHECK_FEEDS, "check_feeds", "check-feeds", cli_only=True),
-        "PRINT_RSS_PROCESSING_STATUS": UserOption("PRINT_RSS_PROCESSING_STATUS", PRINT_RSS_PROCESSING_STATUS, "print_rss_processing_status", "print-rss-processing-status"),
-        "SINGLE_FEED_CHECK": UserOption("SINGLE_FEED_CHECK", SINGLE_FEED_CHECK, "single_feed_check", "single-feed-check", cli_only=True),
-        "SETTINGS_YAML": UserOption("SETTINGS_YAML", SETTINGS_YAML, "settings_yaml", "settings-yaml", cli_only=True),
-        "MAX_CONCURRENT_TASKS": UserOption("MAX_CONCURRENT_TASKS", MAX_CONCURRENT_TASKS, "max_concurrent_tasks", None, yaml_only=True)
-    }
\ No newline at end of file
+# Each spec row describes one UserOption:
+#   - macro_name: the internal constant/macro name used in code (e.g., OUTPUT_HTML_FOLDER);
+#                 its module-level value above is the option default
+#   - yaml_name: the key used in YAML configuration files
+#   - cli_name: the command-line flag name used when running the program (e.g., --output-html-folder)
+#   - cli_only: never loaded from YAML
+#   - yaml_only: never exposed as a CLI argument
+_USER_OPTION_SPECS = (
+    ("DEFAULT_START", "start", "start", False, False),
+    ("DEFAULT_END", "end", "end", False, False),
+    ("OPML_FILENAME", "opml_filename", "opml-filename", False, False),
+    ("OUTPUT_FORMAT", "output_format", "output-format", False, False),
+    ("HTML_REPORT_FOLDER", "output_html_folder", "output-html-folder", False, False),
+    ("CSV_REPORT_FOLDER", "output_csv_folder", "output-csv-folder", False, False),
+    ("JSON_REPORT_FOLDER", "output_json_folder", "output-json-folder", False, False),
+    ("ALIGN_START_TO_MIDNIGHT", "align_start_to_midnight", "align-start-to-midnight", False, False),
+    ("ALIGN_END_TO_MIDNIGHT", "align_end_to_midnight", "align-end-to-midnight", False, False),
+    ("HTML_IMG", "html_img", "html-img", False, False),
+    ("MAX_LENGTH_DESCRIPTION", "max_length_description", "max-length-description", False, False),
+    ("EXCLUDE_KEYWORDS_ENABLED", "exclude_keywords", "exclude-keywords", False, False),
+    ("EXCLUDE_KEYWORDS_FILE", "exclude_keywords_file", "exclude-keywords-file", False, False),
+    ("AGGRESSIVE_FILTERING", "aggressive_filtering", "aggressive-filtering", False, False),
+    ("AGGRESSIVE_KEYWORDS_FILE", "aggressive_keywords_file", "aggressive-keywords-file", False, False),
+    ("PRINT_RETRIEVED", "print_retrieved", "print-retrieved", False, False),
+    ("PRINT_SKIPPED", "print_skipped", "print-skipped", False, False),
+    ("ORDER_BY", "order_by", "order-by", False, False),
+    ("IGNORE_CACHE", "ignore_cache", "ignore-cache", False, False),
+    ("NO_CONDITIONAL_CACHE", "no_conditional_cache", "no-conditional-cache", False, False),
+    ("CACHE_FOLDER", "cache_folder", "cache-folder", False, False),
+    ("ADAPTIVE_REFRESH", "adaptive_refresh", "adaptive-refresh", False, False),
+    ("FORCE_REFRESH", "force_refresh", "force-refresh", False, False),
+    ("CHECK_FEEDS", "check_feeds", "check-feeds", True, False),
+    ("PRINT_RSS_PROCESSING_STATUS", "print_rss_processing_status", "print-rss-processing-status", False, False),
+    ("SINGLE_FEED_CHECK", "single_feed_check", "single-feed-check", True, False),
+    ("SETTINGS_YAML", "settings_yaml", "settings-yaml", True, False),
+    ("MAX_CONCURRENT_TASKS", "max_concurrent_tasks", "max-concurrent-tasks", False, False),
+)
+
+@functools.cache
+def _build_user_options_template():
+    """Return the shared, read-only mapping of default UserOption objects."""
+    module_globals = globals()
+    return MappingProxyType({
+        macro_name: UserOption(macro_name, module_globals[macro_name], yaml_name, cli_name, cli_only, yaml_only)
+        for macro_name, yaml_name, cli_name, cli_only, yaml_only in _USER_OPTION_SPECS
+    })
+
+def build_user_options(mutable=True):
+    """
+    Return all configurable UserOption objects.
+
+    :param mutable: if False, return the shared read-only template (its options must not be modified);
+                    otherwise return a fresh dict of option copies that the caller may update.
+    """
+    template = _build_user_options_template()
+    if not mutable:
+        return template
+    return {name: copy.copy(option) for name, option in template.items()}
\ No newline at end of file
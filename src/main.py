@@ -18,16 +18,17 @@
 
 import os
 import re
-from datetime import datetime, time as dt_time, timezone, timedelta
+import string
+from datetime import datetime, timezone
 import time
 import argparse
-import traceback
+import functools
 import sys
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-from .rss_reader import process_rss_feed, check_rss_health, check_single_feed, FeedOptions
-from .output_writer import write_feed_to_html, write_feed_to_csv, write_feed_to_json, convert_feed_to_json_obj
 from .config import (
     MAX_DAYS_BACK,
     MAX_START_DAYS,
@@ -45,10 +46,11 @@ from .config import (
     TIMEZONE_PRINT,
     MAX_LENGTH_DESCRIPTION,
     MAX_ALLOWED_LENGTH_DESCRIPTION,
-    EXCLUDE_KEYWORDS,
+    MAX_ALLOWED_CONCURRENT_TASKS,
+    DEFAULT_EXCLUDE_KEYWORDS_LC,
     FEED_TITLE_KEY,
     FEED_URL_KEY,
-    CYBERSECURITY_KEYWORDS,
+    CYBERSECURITY_KEYWORDS_LC,
     OUTPUT_FORMAT,
     ALIGN_START_TO_MIDNIGHT,
     ALIGN_END_TO_MIDNIGHT,
@@ -63,27 +65,44 @@ from .config import (
     NO_CONDITIONAL_CACHE,
     CHECK_FEEDS,
     SETTINGS_YAML,
+    CACHE_FOLDER,
     build_user_options
 )
-from .utils import print_feed_details, load_yaml_config
 
-def validate_start(value):
-    value = int(value)
-    if value > MAX_START_DAYS:
-        raise argparse.ArgumentTypeError(f"Start day offset must be less than or equal to {MAX_START_DAYS}.")
-    return value
+# Characters allowed in output filename prefixes
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+_FILENAME_TRANS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if chr(c) not in _SAFE_FILENAME_CHARS))
+_FILENAME_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
 
-def validate_end(value):
-    value = int(value)
-    if value > MAX_END_DAYS:
-        raise argparse.ArgumentTypeError(f"End day offset must be less than or equal to {MAX_END_DAYS}.")
-    return value
+SECONDS_PER_DAY = 86400
 
-def validate_max_length_description(value):
-    value = int(value)
-    if value <= 0 or value > MAX_ALLOWED_LENGTH_DESCRIPTION:
-        raise argparse.ArgumentTypeError(f"max-length-description must be between 1 and {MAX_ALLOWED_LENGTH_DESCRIPTION}.")
-    return value
+# The feed reader, output writers and utils pull in feedparser, aiohttp, bs4,
+# tldextract and yaml; they are imported where needed so that --help and
+# argument errors return without loading them.
+
+def _bounded_int(name, maximum, message, minimum=None):
+    """Returns an argparse type that parses an int and rejects values outside [minimum, maximum]."""
+    def validate(value):
+        value = int(value)
+        if value > maximum or (minimum is not None and value < minimum):
+            raise argparse.ArgumentTypeError(message)
+        return value
+    # argparse names the type in its "invalid <name> value" error
+    validate.__name__ = name
+    return validate
+
+validate_start = _bounded_int(
+    "validate_start", MAX_START_DAYS,
+    f"Start day offset must be less than or equal to {MAX_START_DAYS}.")
+validate_end = _bounded_int(
+    "validate_end", MAX_END_DAYS,
+    f"End day offset must be less than or equal to {MAX_END_DAYS}.")
+validate_max_length_description = _bounded_int(
+    "validate_max_length_description", MAX_ALLOWED_LENGTH_DESCRIPTION,
+    f"max-length-description must be between 1 and {MAX_ALLOWED_LENGTH_DESCRIPTION}.", minimum=1)
+validate_max_concurrent_tasks = _bounded_int(
+    "validate_max_concurrent_tasks", MAX_ALLOWED_CONCURRENT_TASKS,
+    f"max-concurrent-tasks must be between 1 and {MAX_ALLOWED_CONCURRENT_TASKS}.", minimum=1)
 
 def validate_feed_url(value: str) -> str:
     """Ensure the provided feed URL is a non-empty, valid URL."""
@@ -94,196 +113,180 @@ def validate_feed_url(value: str) -> str:
         raise argparse.ArgumentTypeError(f"Invalid URL: {value}")
     return value
 
-def parse_arguments(user_options, argv=None):
-    description = (
-        "Cyberfeedbites collects and summarises the latest cybersecurity news from "
-        f"RSS feeds listed in the default OPML file ({user_options['OPML_FILENAME'].value}), generating HTML, CSV, and JSON reports. "
-        f"By default, reports are saved in these folders: HTML ({user_options['HTML_REPORT_FOLDER'].value}), "
-        f"CSV ({user_options['CSV_REPORT_FOLDER'].value}), and JSON ({user_options['JSON_REPORT_FOLDER'].value})."
-    )
-    parser = argparse.ArgumentParser(description=description)
+def output_format_type(value):
+    if value is None or value.lower() == "none":
+        return None
+    return value
 
-    def output_format_type(value):
-        if value is None or value.lower() == "none":
-            return None
+def normalize_output_formats(value):
+    """
+    Returns the requested output formats as a frozenset of lower-cased names.
+    Accepts None, a comma-separated string (CLI/YAML) or an already normalised collection.
+    """
+    if not value:
+        return frozenset()
+    if isinstance(value, frozenset):
         return value
+    if isinstance(value, str):
+        value = value.split(",")
+    return frozenset(fmt.strip().lower() for fmt in value if fmt.strip())
+
+# argparse settings and help text for each CLI option, keyed by UserOption macro name.
+# argparse expands '%(default)s' in the help text to the option's current value when --help is shown.
+_CLI_ARGUMENTS = {
+    "DEFAULT_START": (
+        {"type": validate_start},
+        "Start day offset (days ago) to look back from today. Default is %(default)s."
+    ),
+    "DEFAULT_END": (
+        {"type": validate_end},
+        "End day offset (days ago) to end looking back. Default is %(default)s (today)."
+    ),
+    "OPML_FILENAME": (
+        {"type": str},
+        "Path to the OPML file. Default is '%(default)s'."
+    ),
+    "OUTPUT_FORMAT": (
+        {"type": output_format_type, "nargs": '?', "const": None},
+        "Comma-separated list of output formats to generate: html, csv, json. "
+        "Use 'None' or omit value for no output. Default is %(default)s."
+    ),
+    "HTML_REPORT_FOLDER": (
+        {"type": str},
+        "Output folder for HTML reports. Default is %(default)s."
+    ),
+    "CSV_REPORT_FOLDER": (
+        {"type": str},
+        "Output folder for CSV reports. Default is %(default)s."
+    ),
+    "JSON_REPORT_FOLDER": (
+        {"type": str},
+        "Output folder for JSON reports. Default is %(default)s."
+    ),
+    "ALIGN_START_TO_MIDNIGHT": (
+        {"action": "store_true"},
+        "Align the start date to midnight of the first day instead of counting exact hours back."
+    ),
+    "ALIGN_END_TO_MIDNIGHT": (
+        {"action": "store_true"},
+        "Align the end date to 23:59:59 of the end day instead of current time."
+    ),
+    "HTML_IMG": (
+        {"action": "store_true"},
+        "Include images in the HTML output. Default is %(default)s."
+    ),
+    "MAX_LENGTH_DESCRIPTION": (
+        {"type": validate_max_length_description},
+        "Maximum length for RSS feed descriptions. Default is %(default)s."
+    ),
+    "EXCLUDE_KEYWORDS_ENABLED": (
+        {"action": "store_true"},
+        "Enable exclusion of articles containing specific keywords. Default is %(default)s."
+    ),
+    "EXCLUDE_KEYWORDS_FILE": (
+        {"type": str},
+        "Path to a file containing keywords to exclude, one per line. Default is %(default)s."
+    ),
+    "AGGRESSIVE_FILTERING": (
+        {"action": "store_true"},
+        "Enable removal of articles that do NOT include any security keywords. Default is %(default)s."
+    ),
+    "AGGRESSIVE_KEYWORDS_FILE": (
+        {"type": str},
+        "Path to a file containing security keywords to keep, one per line. Default is %(default)s."
+    ),
+    "PRINT_RETRIEVED": (
+        {"action": "store_true"},
+        "Print retrieved articles at the end of processing. Default is %(default)s."
+    ),
+    "PRINT_SKIPPED": (
+        {"action": "store_true"},
+        "Print skipped articles at the end of processing. Default is %(default)s."
+    ),
+    "ORDER_BY": (
+        {"type": str, "choices": ["date", "title_date"]},
+        "Order for HTML output: 'date' (default) or 'title_date'. Default is %(default)s."
+    ),
+    "IGNORE_CACHE": (
+        {"action": "store_true"},
+        "Disable cache completely (always fetch online). Default is %(default)s."
+    ),
+    "NO_CONDITIONAL_CACHE": (
+        {"action": "store_false"},
+        "Always use cached copy without conditional headers (If-Modified-Since / ETag). Default is %(default)s."
+    ),
+    "CACHE_FOLDER": (
+        {"type": str},
+        "Folder where fetched feeds and their HTTP cache metadata are stored. Default is %(default)s."
+    ),
+    "ADAPTIVE_REFRESH": (
+        {"action": "store_true"},
+        "Reuse a cached feed without contacting the server until new entries are expected. Default is %(default)s."
+    ),
+    "FORCE_REFRESH": (
+        {"action": "store_true"},
+        "Fetch every feed even when adaptive refresh is enabled. Default is %(default)s."
+    ),
+    "MAX_CONCURRENT_TASKS": (
+        {"type": validate_max_concurrent_tasks},
+        "Maximum number of feeds fetched concurrently. Default is %(default)s."
+    ),
+    "CHECK_FEEDS": (
+        {"action": "store_true"},
+        "Perform a quick RSS health check. Default is %(default)s."
+    ),
+    "PRINT_RSS_PROCESSING_STATUS": (
+        {"action": "store_true"},
+        "Print status of RSS processing for each entry. Default is %(default)s."
+    ),
+    "SETTINGS_YAML": (
+        {"type": str},
+        "Path to a YAML configuration file. Default is '%(default)s'."
+    ),
+    "SINGLE_FEED_CHECK": (
+        {"type": validate_feed_url, "metavar": "FEED_URL"},
+        "Perform a quick health check for a single RSS feed URL. "
+        "Provide the feed URL as argument. Example: "
+        "--single-feed-check https://example.com/feed"
+    ),
+}
+
+def help_requested(cli_args):
+    """True if the arguments ask for --help (including unambiguous prefixes such as --he)."""
+    return any(arg == "-h" or (len(arg) > 3 and "--help".startswith(arg)) for arg in cli_args)
+
+@functools.lru_cache(maxsize=4)
+def _build_parser(option_values, with_description):
+    """
+    Builds the argument parser for a given set of option defaults. Cached, so repeated
+    parse_arguments calls with unchanged options (tests, REPL, library use) reuse one parser.
+    """
+    values = dict(option_values)
+    template = build_user_options(mutable=False)
+
+    # The description is only shown by --help, so skip formatting it otherwise
+    description = None
+    if with_description:
+        description = (
+            "Cyberfeedbites collects and summarises the latest cybersecurity news from "
+            f"RSS feeds listed in the default OPML file ({values['OPML_FILENAME']}), generating HTML, CSV, and JSON reports. "
+            f"By default, reports are saved in these folders: HTML ({values['HTML_REPORT_FOLDER']}), "
+            f"CSV ({values['CSV_REPORT_FOLDER']}), and JSON ({values['JSON_REPORT_FOLDER']})."
+        )
+    parser = argparse.ArgumentParser(description=description)
 
-    parser.add_argument(
-        f"--{user_options['DEFAULT_START'].cli_name}",
-        type=validate_start,
-        default=user_options['DEFAULT_START'].value,
-        help=f"Start day offset (days ago) to look back from today. Default is {user_options['DEFAULT_START'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['DEFAULT_END'].cli_name}",
-        type=validate_end,
-        default=user_options['DEFAULT_END'].value,
-        help=f"End day offset (days ago) to end looking back. Default is {user_options['DEFAULT_END'].value} (today)."
-    )
-
-    parser.add_argument(
-        f"--{user_options['OPML_FILENAME'].cli_name}",
-        type=str,
-        default=user_options['OPML_FILENAME'].value,
-        help=f"Path to the OPML file. Default is '{user_options['OPML_FILENAME'].value}'."
-    )
-
-    parser.add_argument(
-        f"--{user_options['OUTPUT_FORMAT'].cli_name}",
-        type=output_format_type,
-        nargs='?',
-        const=None,
-        default=user_options['OUTPUT_FORMAT'].value,
-        help=f"Comma-separated list of output formats to generate: html, csv, json. "
-             f"Use 'None' or omit value for no output. Default is {user_options['OUTPUT_FORMAT'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['HTML_REPORT_FOLDER'].cli_name}",
-        type=str,
-        default=user_options['HTML_REPORT_FOLDER'].value,
-        help=f"Output folder for HTML reports. Default is {user_options['HTML_REPORT_FOLDER'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['CSV_REPORT_FOLDER'].cli_name}",
-        type=str,
-        default=user_options['CSV_REPORT_FOLDER'].value,
-        help=f"Output folder for CSV reports. Default is {user_options['CSV_REPORT_FOLDER'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['JSON_REPORT_FOLDER'].cli_name}",
-        type=str,
-        default=user_options['JSON_REPORT_FOLDER'].value,
-        help=f"Output folder for JSON reports. Default is {user_options['JSON_REPORT_FOLDER'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['ALIGN_START_TO_MIDNIGHT'].cli_name}",
-        action="store_true",
-        default=user_options['ALIGN_START_TO_MIDNIGHT'].value,
-        help="Align the start date to midnight of the first day instead of counting exact hours back."
-    )
-
-    parser.add_argument(
-        f"--{user_options['ALIGN_END_TO_MIDNIGHT'].cli_name}",
-        action="store_true",
-        default=user_options['ALIGN_END_TO_MIDNIGHT'].value,
-        help="Align the end date to 23:59:59 of the end day instead of current time."
-    )
-
-    parser.add_argument(
-        f"--{user_options['HTML_IMG'].cli_name}",
-        action="store_true",
-        default=user_options['HTML_IMG'].value,
-        help=f"Include images in the HTML output. Default is {user_options['HTML_IMG'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['MAX_LENGTH_DESCRIPTION'].cli_name}",
-        type=validate_max_length_description,
-        default=user_options['MAX_LENGTH_DESCRIPTION'].value,
-        help=f"Maximum length for RSS feed descriptions. Default is {user_options['MAX_LENGTH_DESCRIPTION'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['EXCLUDE_KEYWORDS'].cli_name}",
-        action="store_true",
-        default=user_options['EXCLUDE_KEYWORDS'].value,
-        help=f"Enable exclusion of articles containing specific keywords. Default is {user_options['EXCLUDE_KEYWORDS'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['EXCLUDE_KEYWORDS_FILE'].cli_name}",
-        type=str,
-        default=user_options['EXCLUDE_KEYWORDS_FILE'].value,
-        help=f"Path to a file containing keywords to exclude, one per line. Default is {user_options['EXCLUDE_KEYWORDS_FILE'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['AGGRESSIVE_FILTERING'].cli_name}",
-        action="store_true",
-        default=user_options['AGGRESSIVE_FILTERING'].value,
-        help=f"Enable removal of articles that do NOT include any security keywords. Default is {user_options['AGGRESSIVE_FILTERING'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['AGGRESSIVE_KEYWORDS_FILE'].cli_name}",
-        type=str,
-        default=user_options['AGGRESSIVE_KEYWORDS_FILE'].value,
-        help=f"Path to a file containing security keywords to keep, one per line. Default is {user_options['AGGRESSIVE_KEYWORDS_FILE'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['PRINT_RETRIEVED'].cli_name}",
-        action="store_true",
-        default=user_options['PRINT_RETRIEVED'].value,
-        help=f"Print retrieved articles at the end of processing. Default is {user_options['PRINT_RETRIEVED'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['PRINT_SKIPPED'].cli_name}",
-        action="store_true",
-        default=user_options['PRINT_SKIPPED'].value,
-        help=f"Print skipped articles at the end of processing. Default is {user_options['PRINT_SKIPPED'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['ORDER_BY'].cli_name}",
-        type=str,
-        choices=["date", "title_date"],
-        default=user_options['ORDER_BY'].value,
-        help=f"Order for HTML output: 'date' (default) or 'title_date'. Default is {user_options['ORDER_BY'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['IGNORE_CACHE'].cli_name}",
-        action="store_true",
-        default=user_options['IGNORE_CACHE'].value,
-        help=f"Disable cache completely (always fetch online). Default is {user_options['IGNORE_CACHE'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['NO_CONDITIONAL_CACHE'].cli_name}",
-        action="store_false",
-        default=user_options['NO_CONDITIONAL_CACHE'].value,
-        help=f"Always use cached copy without conditional headers (If-Modified-Since / ETag). Default is {user_options['NO_CONDITIONAL_CACHE'].value}."
-    )
-
-    parser.add_argument(
-        f"--{user_options['CHECK_FEEDS'].cli_name}",
-        action="store_true",
-        default=user_options['CHECK_FEEDS'].value,
-        help=f"Perform a quick RSS health check. Default is {user_options['CHECK_FEEDS'].value}."
-    )
+    defaults = {}
+    for macro_name, (argument_settings, help_text) in _CLI_ARGUMENTS.items():
+        action = parser.add_argument(f"--{template[macro_name].cli_name}", help=help_text, **argument_settings)
+        defaults[action.dest] = values[macro_name]
+    parser.set_defaults(**defaults)
 
-    parser.add_argument(
-        f"--{user_options['PRINT_RSS_PROCESSING_STATUS'].cli_name}",
-        action="store_true",
-        default=user_options['PRINT_RSS_PROCESSING_STATUS'].value,
-        help=f"Print status of RSS processing for each entry. Default is {user_options['PRINT_RSS_PROCESSING_STATUS'].value}."
-    )
+    return parser
 
-    parser.add_argument(
-        f"--{user_options['SETTINGS_YAML'].cli_name}",
-        type=str,
-        default=user_options['SETTINGS_YAML'].value,
-        help=f"Path to a YAML configuration file. Default is '{user_options['SETTINGS_YAML'].value}'."
-    )
-
-    parser.add_argument(
-        f"--{user_options['SINGLE_FEED_CHECK'].cli_name}",
-        type=validate_feed_url,
-        default=user_options['SINGLE_FEED_CHECK'].value,
-        metavar="FEED_URL",
-        help=(
-            "Perform a quick health check for a single RSS feed URL. "
-            "Provide the feed URL as argument. Example: "
-            "--single-feed-check https://example.com/feed"
-        )
-    )
+def parse_arguments(user_options, argv=None):
+    option_values = tuple((macro_name, user_options[macro_name].value) for macro_name in _CLI_ARGUMENTS)
+    with_description = help_requested(sys.argv[1:] if argv is None else argv)
+    parser = _build_parser(option_values, with_description)
 
     args = parser.parse_args(argv)
 
@@ -295,10 +298,54 @@ def parse_arguments(user_options, argv=None):
 
     return args
 
+def make_filename_prefix(text):
+    """Lowercases 'text' and strips every character outside [a-zA-Z0-9_]."""
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_FILENAME_TRANS)
+    return _FILENAME_SANITIZE_RE.sub('', text)
+
+def get_output_prefix(opml_filename, cache_folder=CACHE_FOLDER, ignore_cache=False):
+    """
+    Returns the output filename prefix for an OPML file, derived from the 'category'
+    (or 'text') attribute of its top-level outline. The OPML parse is cached (see load_opml),
+    so this does not add a second parse to the run.
+    """
+    from .rss_reader import load_opml
+    try:
+        _, _, opml_text, _, opml_category = load_opml(opml_filename, cache_folder, ignore_cache)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"The OPML file '{opml_filename}' does not exist.") from e
+    except Exception as e:
+        raise RuntimeError(f"Error reading OPML file '{opml_filename}': {e}") from e
+
+    base = opml_category or opml_text
+    if not base:
+        raise ValueError("Missing both 'category' and 'text' fields — cannot generate prefix.")
+    return make_filename_prefix(base)
+
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
+def build_output_path(folder, prefix, suffix, extension):
+    """Returns '<folder>/<prefix>_<suffix>.<extension>' using plain string formatting."""
+    return f"{folder.rstrip(_PATH_SEPARATORS)}{os.sep}{prefix}_{suffix}.{extension}"
+
 def prepare_output_folder(folder_path):
+    """Creates 'folder_path' if needed. run_main_logic calls it once per distinct folder per run."""
     if folder_path:
         os.makedirs(folder_path, exist_ok=True)
 
+def format_grouped_entries(entries):
+    """Returns the summary lines for 'entries', grouped by feed (title, URL) in sorted order."""
+    from .utils import format_feed_details
+
+    feed_key = itemgetter(FEED_TITLE_KEY, FEED_URL_KEY)
+    lines = []
+    # sorted() is stable, so articles keep their original order within each feed
+    for (feedtitle, feed_url), articles in groupby(sorted(entries, key=feed_key), key=feed_key):
+        lines.extend(format_feed_details(feedtitle, feed_url, list(articles)))
+    return lines
+
 def print_summary(
     start_date_print,
     end_date_print,
@@ -314,285 +361,318 @@ def print_summary(
     start_time,
     end_time
 ):
-    """Prints a summary of the run."""
-    print(f"{FEED_SEPARATOR}")
-
-    print(f"Time range: {start_date_print} {TIMEZONE_PRINT} to {end_date_print} {TIMEZONE_PRINT}")
-    print(f"OPML file: {opml_filename}")
-
-    print(f"Retrieved articles: {len(entries)}")
+    """Prints a summary of the run with a single write to stdout."""
+    lines = [
+        FEED_SEPARATOR,
+        f"Time range: {start_date_print} {TIMEZONE_PRINT} to {end_date_print} {TIMEZONE_PRINT}",
+        f"OPML file: {opml_filename}",
+        f"Retrieved articles: {len(entries)}",
+    ]
     if print_retrieved_entries:
-        grouped_entries = defaultdict(list)
-        for entry in entries:
-            key = (entry[FEED_TITLE_KEY], entry[FEED_URL_KEY])
-            grouped_entries[key].append(entry)
-
-        for (feedtitle, feed_url) in sorted(grouped_entries.keys()):
-            articles = grouped_entries[(feedtitle, feed_url)]
-            print_feed_details(feedtitle, feed_url, articles)
+        lines.extend(format_grouped_entries(entries))
 
-    print(f"Skipped articles: {len(skipped_entries)}")
+    lines.append(f"Skipped articles: {len(skipped_entries)}")
     if print_skipped_entries:
-        grouped_skipped_entries = defaultdict(list)
-        for skipped in skipped_entries:
-            key = (skipped[FEED_TITLE_KEY], skipped[FEED_URL_KEY])
-            grouped_skipped_entries[key].append(skipped)
-
-        for (feedtitle, feed_url) in sorted(grouped_skipped_entries.keys()):
-            articles = grouped_skipped_entries[(feedtitle, feed_url)]
-            print_feed_details(feedtitle, feed_url, articles)
+        lines.extend(format_grouped_entries(skipped_entries))
 
     if html_outfilename:
-        print(f"HTML written to file: {html_outfilename}")
+        lines.append(f"HTML written to file: {html_outfilename}")
     if csv_outfilename:
-        print(f"CSV written to file: {csv_outfilename}")
+        lines.append(f"CSV written to file: {csv_outfilename}")
     if json_outfilename:
-        print(f"json written to file: {json_outfilename}")
+        lines.append(f"json written to file: {json_outfilename}")
 
     if errors:
-        print("Feeds that failed to fetch:")
+        lines.append("Feeds that failed to fetch:")
         for feedtitle, feed_url, exception in errors:
-            print(f"\t- {feedtitle}: {feed_url}")
+            lines.append(f"\t- {feedtitle}: {feed_url}")
+
+    lines.append(f"Total execution time: {end_time - start_time:.2f} seconds")
+    lines.append(FEED_SEPARATOR)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+@functools.lru_cache(maxsize=16)
+def _read_keywords(path, mtime_ns, size):
+    with open(path, "r", encoding="utf-8") as f:
+        # One bulk lower() and splitlines() over the whole file
+        return frozenset(kw for kw in map(str.strip, f.read().lower().splitlines()) if kw)
+
+def load_keywords_file(path):
+    """
+    Returns the lower-cased, non-empty lines of a keyword file as a frozenset. Cached by path,
+    modification time and size, so repeated runs in one process do not re-read an unchanged file.
+    """
+    st = os.stat(path)
+    return _read_keywords(path, st.st_mtime_ns, st.st_size)
+
+def report_errors(func):
+    """
+    Decorator: an uncaught exception is reported on stderr and turned into exit code 1.
+    The full traceback is only printed when CYBERFEEDBITES_DEBUG is set.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            if os.environ.get("CYBERFEEDBITES_DEBUG"):
+                import traceback
+                traceback.print_exc()
+            return 1
+    return wrapper
+
+@report_errors
+def run_cyberfeedbites(argv=None, return_raw_json=False):
+    user_options = build_user_options()
+
+    # 1. Parse CLI arguments
+    args = parse_arguments(user_options, argv)
+
+    # 2. Determine OPML file and any “check” flags
+    check_feeds_flag = getattr(args, "check_feeds", False)
+    single_feed_url = getattr(args, "single_feed_check", None)
+
+    if check_feeds_flag:
+        from .rss_reader import check_rss_health
+        opml_file = getattr(args, "opml_filename", user_options["OPML_FILENAME"].value)
+        check_rss_health(
+            opml_file,
+            getattr(args, "cache_folder", None) or CACHE_FOLDER,
+            getattr(args, "ignore_cache", False)
+        )
+        return 0
 
-    print(f"Total execution time: {end_time - start_time:.2f} seconds")
-    print(f"{FEED_SEPARATOR}")
+    if single_feed_url:
+        from .rss_reader import check_single_feed
+        check_single_feed(single_feed_url)
+        return 0
+    
+    # 3. Load YAML config
+    from .utils import load_yaml_config
+    yaml_path = getattr(args, "settings_yaml", user_options["SETTINGS_YAML"].value)
+    yaml_settings = load_yaml_config(yaml_path, user_options)
+
+    # 4. Update user_options from YAML
+    for option in user_options.values():
+        if not option.cli_only and option.yaml_name in yaml_settings:
+            option.set_from_yaml(yaml_settings)
+
+    # 5. Override user_options with CLI arguments if explicitly passed
+    cli_args = argv if argv is not None else sys.argv[1:]
+    cli_flags = frozenset(arg.partition("=")[0] for arg in cli_args if arg.startswith("--"))
+
+    for option in user_options.values():
+        if not option.yaml_only:
+            cli_flag = f"--{option.cli_name}"
+            if cli_flag in cli_flags:
+                option.value = getattr(args, option.yaml_name)
+
+    # 6. Print resolved values
+    """ for option in user_options.values():
+        if option.yaml_only:
+            # Print only if YAML actually changed it
+            if option.value != option.default:
+                print(f"{option.macro_name}: {option.value}")
+        else:
+            print(f"{option.macro_name}: {option.value}") """
 
-def run_cyberfeedbites(argv=None, return_raw_json=False):
-    try:
-        user_options = build_user_options()
-
-        # 1. Parse CLI arguments
-        args = parse_arguments(user_options, argv)
-
-        # 2. Determine OPML file and any “check” flags
-        check_feeds_flag = getattr(args, "check_feeds", False)
-        single_feed_url = getattr(args, "single_feed_check", None)
-
-        if check_feeds_flag:
-            opml_file = getattr(args, "opml_filename", user_options["OPML_FILENAME"].value)
-            check_rss_health(opml_file)
-            return 0
-
-        if single_feed_url:
-            check_single_feed(single_feed_url)
-            return 0
-        
-        # 3. Load YAML config
-        yaml_path = getattr(args, "settings_yaml", user_options["SETTINGS_YAML"].value)
-        yaml_settings = load_yaml_config(yaml_path, user_options)
-
-        # 4. Update user_options from YAML
-        for option in user_options.values():
-            if not option.cli_only and option.yaml_name in yaml_settings:
-                option.set_from_yaml(yaml_settings)
-
-        # 5. Override user_options with CLI arguments if explicitly passed
-        cli_args = argv if argv is not None else sys.argv[1:]
-        cli_flags = {arg.split("=")[0] for arg in cli_args if arg.startswith("--")}
-
-        for option in user_options.values():
-            if not option.yaml_only:
-                cli_flag = f"--{option.cli_name}"
-                if cli_flag in cli_flags:
-                    option.value = getattr(args, option.yaml_name)
-
-        # 6. Print resolved values
-        """ for option in user_options.values():
-            if option.yaml_only:
-                # Print only if YAML actually changed it
-                if option.value != option.default:
-                    print(f"{option.macro_name}: {option.value}")
-            else:
-                print(f"{option.macro_name}: {option.value}") """
-
-        # 7. Ensure OUTPUT_FORMAT is lowercased and comma-separated
-        output_format_option = user_options['OUTPUT_FORMAT'].value
-        if output_format_option:
-            user_options['OUTPUT_FORMAT'].value = ",".join(fmt.strip().lower() for fmt in output_format_option.split(","))
-
-        # 7. Run main logic
-        return run_main_logic(user_options, return_raw_json)
+    # 7. Normalise OUTPUT_FORMAT once into a frozenset of lower-cased formats
+    user_options['OUTPUT_FORMAT'].value = normalize_output_formats(user_options['OUTPUT_FORMAT'].value)
 
-    except Exception as e:
-        print(f"Error: {e}")
-        traceback.print_exc()
-        return 1
+    # 7. Run main logic
+    return run_main_logic(user_options, return_raw_json)
 
+@report_errors
 def run_main_logic(user_options, return_raw_json=False):
-    try:
-        opml_filename = user_options["OPML_FILENAME"].value
-
-        max_length_description = user_options["MAX_LENGTH_DESCRIPTION"].value
-        output_format_option = user_options["OUTPUT_FORMAT"].value
-        if output_format_option is None:
-            output_formats = set()
+    from .rss_reader import process_rss_feed, FeedOptions
+    from .output_writer import write_feed_to_html, write_feed_to_csv, write_feed_to_json, convert_feed_to_json_obj, sort_posts_by_date
+
+    opml_filename = user_options["OPML_FILENAME"].value
+
+    max_length_description = user_options["MAX_LENGTH_DESCRIPTION"].value
+    # Already a frozenset when called through run_cyberfeedbites; normalising it again is a no-op
+    output_formats = normalize_output_formats(user_options["OUTPUT_FORMAT"].value)
+
+    html_folder = user_options["HTML_REPORT_FOLDER"].value or HTML_REPORT_FOLDER
+    csv_folder = user_options["CSV_REPORT_FOLDER"].value or CSV_REPORT_FOLDER
+    json_folder = user_options["JSON_REPORT_FOLDER"].value or JSON_REPORT_FOLDER
+
+    aggressive_filtering = user_options["AGGRESSIVE_FILTERING"].value
+    aggressive_keywords = frozenset()
+
+    if aggressive_filtering:
+        aggressive_file = user_options["AGGRESSIVE_KEYWORDS_FILE"].value
+        if aggressive_file:
+            try:
+                aggressive_keywords = load_keywords_file(aggressive_file)
+            except Exception as e:
+                print(f"Error reading aggressive keywords file '{aggressive_file}': {e}", file=sys.stderr)
+                return 1
         else:
-            output_formats = {fmt.strip().lower() for fmt in output_format_option.split(",")}
-
-        html_folder = user_options["HTML_REPORT_FOLDER"].value or HTML_REPORT_FOLDER
-        csv_folder = user_options["CSV_REPORT_FOLDER"].value or CSV_REPORT_FOLDER
-        json_folder = user_options["JSON_REPORT_FOLDER"].value or JSON_REPORT_FOLDER
-
-        aggressive_filtering = user_options["AGGRESSIVE_FILTERING"].value
-        aggressive_keywords = []
-
-        if aggressive_filtering:
-            aggressive_file = user_options["AGGRESSIVE_KEYWORDS_FILE"].value
-            if aggressive_file:
-                try:
-                    with open(aggressive_file, "r", encoding="utf-8") as f:
-                        aggressive_keywords = [line.strip().lower() for line in f if line.strip()]
-                except Exception as e:
-                    print(f"Error reading aggressive keywords file '{aggressive_file}': {e}")
-                    return 1
-            else:
-                aggressive_keywords = [kw.lower() for kw in CYBERSECURITY_KEYWORDS]
-
-        exclude_keywords = []
-        if user_options["EXCLUDE_KEYWORDS"].value:
-            exclude_file = user_options["EXCLUDE_KEYWORDS_FILE"].value
-            if exclude_file:
-                try:
-                    with open(exclude_file, "r", encoding="utf-8") as f:
-                        exclude_keywords = [line.strip().lower() for line in f if line.strip()]
-                except Exception as e:
-                    print(f"Error reading exclude keywords file '{exclude_file}': {e}")
-                    return 1
-            else:
-                exclude_keywords = [kw.lower() for kw in EXCLUDE_KEYWORDS]
-
-        print_retrieved_entries = user_options["PRINT_RETRIEVED"].value
-        print_skipped_entries = user_options["PRINT_SKIPPED"].value
-        order_by = user_options["ORDER_BY"].value
-        ignore_cache = user_options["IGNORE_CACHE"].value
-        no_conditional_cache = user_options["NO_CONDITIONAL_CACHE"].value
-        print_rss_processing_status = user_options["PRINT_RSS_PROCESSING_STATUS"].value
-
-        start_time = time.time()
-        current_date = datetime.now(timezone.utc)
-        start_date = current_date - timedelta(days=user_options["DEFAULT_START"].value)
-        end_date = current_date - timedelta(days=user_options["DEFAULT_END"].value)
-
-        if user_options["ALIGN_START_TO_MIDNIGHT"].value:
-            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        if user_options["ALIGN_END_TO_MIDNIGHT"].value:
-            end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-
-        current_date_string_filename_suffix = current_date.strftime(TEXT_DATE_FORMAT_FILE)
-        start_date_string_print = start_date.strftime(TEXT_DATE_FORMAT_PRINT)
-        end_date_string_print = end_date.strftime(TEXT_DATE_FORMAT_PRINT)
-        current_date_string_print_json = current_date.strftime(TEXT_DATE_FORMAT_JSON)
-        start_date_string_print_json = start_date.strftime(TEXT_DATE_FORMAT_JSON)
-        end_date_string_print_json = end_date.strftime(TEXT_DATE_FORMAT_JSON)
-
-        feed_options = FeedOptions(
-            start_date=start_date,
-            end_date=end_date,
-            max_length_description=max_length_description,
-            exclude_keywords=exclude_keywords,
-            aggressive_keywords=aggressive_keywords,
-            ignore_cache=ignore_cache,
-            no_conditional_cache=no_conditional_cache,
-            print_rss_processing_status = print_rss_processing_status
-        )
+            aggressive_keywords = frozenset(CYBERSECURITY_KEYWORDS_LC)
+
+    exclude_keywords = frozenset()
+    if user_options["EXCLUDE_KEYWORDS_ENABLED"].value:
+        exclude_file = user_options["EXCLUDE_KEYWORDS_FILE"].value
+        if exclude_file:
+            try:
+                exclude_keywords = load_keywords_file(exclude_file)
+            except Exception as e:
+                print(f"Error reading exclude keywords file '{exclude_file}': {e}", file=sys.stderr)
+                return 1
+        else:
+            exclude_keywords = frozenset(DEFAULT_EXCLUDE_KEYWORDS_LC)
+
+    print_retrieved_entries = user_options["PRINT_RETRIEVED"].value
+    print_skipped_entries = user_options["PRINT_SKIPPED"].value
+    order_by = user_options["ORDER_BY"].value
+    ignore_cache = user_options["IGNORE_CACHE"].value
+    no_conditional_cache = user_options["NO_CONDITIONAL_CACHE"].value
+    cache_folder = user_options["CACHE_FOLDER"].value or CACHE_FOLDER
+    print_rss_processing_status = user_options["PRINT_RSS_PROCESSING_STATUS"].value
+
+    # Work on UTC epoch seconds; midnight boundaries are whole multiples of a day
+    start_time = time.time()
+    current_ts = start_time
+    start_ts = current_ts - user_options["DEFAULT_START"].value * SECONDS_PER_DAY
+    end_ts = current_ts - user_options["DEFAULT_END"].value * SECONDS_PER_DAY
+
+    if user_options["ALIGN_START_TO_MIDNIGHT"].value:
+        start_ts -= start_ts % SECONDS_PER_DAY
+
+    if user_options["ALIGN_END_TO_MIDNIGHT"].value:
+        # 23:59:59.999999 of the end day
+        end_ts = end_ts - end_ts % SECONDS_PER_DAY + SECONDS_PER_DAY - 1e-6
+
+    start_date = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+    end_date = datetime.fromtimestamp(end_ts, tz=timezone.utc)
+
+    # Run-level timestamps are unique to each run, so they are formatted directly
+    # rather than through the memoised per-entry format_timestamp
+    current_date = datetime.fromtimestamp(current_ts, tz=timezone.utc)
+    current_date_string_filename_suffix = current_date.strftime(TEXT_DATE_FORMAT_FILE)
+    start_date_string_print = start_date.strftime(TEXT_DATE_FORMAT_PRINT)
+    end_date_string_print = end_date.strftime(TEXT_DATE_FORMAT_PRINT)
+    current_date_string_print_json = current_date.strftime(TEXT_DATE_FORMAT_JSON)
+    start_date_string_print_json = start_date.strftime(TEXT_DATE_FORMAT_JSON)
+    end_date_string_print_json = end_date.strftime(TEXT_DATE_FORMAT_JSON)
+
+    feed_options = FeedOptions(
+        start_date=start_date,
+        end_date=end_date,
+        max_length_description=max_length_description,
+        exclude_keywords=exclude_keywords,
+        aggressive_keywords=aggressive_keywords,
+        ignore_cache=ignore_cache,
+        no_conditional_cache=no_conditional_cache,
+        print_rss_processing_status = print_rss_processing_status,
+        max_concurrent_tasks=user_options["MAX_CONCURRENT_TASKS"].value,
+        cache_folder=cache_folder,
+        adaptive_refresh=user_options["ADAPTIVE_REFRESH"].value,
+        force_refresh=user_options["FORCE_REFRESH"].value
+    )
 
-        all_entries, skipped_entries, icon_map, opml_text, opml_title, opml_category, errors = process_rss_feed(opml_filename, feed_options)
-
-        base = opml_category or opml_text
-        if not base:
-            raise ValueError("Missing both 'category' and 'text' fields — cannot generate prefix.")
-        out_filename_prefix = re.sub(r'[^a-zA-Z0-9_]', '', base.lower())
-
-        html_outfilename = None
-        csv_outfilename = None
-        json_outfilename = None
-        json_data = None
-
-        if "json" in output_formats or return_raw_json:
-            json_data = convert_feed_to_json_obj(
-                all_entries,
-                current_date_string_print_json,
-                start_date_string_print_json,
-                end_date_string_print_json,
-                opml_text,
-                opml_title,
-                opml_category
-            )
-
-        if "html" in output_formats:
-            prepare_output_folder(html_folder)
-            html_outfilename = os.path.join(html_folder, f"{out_filename_prefix}_{current_date_string_filename_suffix}.html")
-
-        if "csv" in output_formats:
-            prepare_output_folder(csv_folder)
-            csv_outfilename = os.path.join(csv_folder, f"{out_filename_prefix}_{current_date_string_filename_suffix}.csv")
-
-        if "json" in output_formats:
-            prepare_output_folder(json_folder)
-            json_outfilename = os.path.join(json_folder, f"{out_filename_prefix}_{current_date_string_filename_suffix}.json")
-
-        if "html" in output_formats:
-            include_images = user_options["HTML_IMG"].value
-            write_feed_to_html(
-                all_entries,
-                html_outfilename,
-                start_date_string_print,
-                end_date_string_print,
-                icon_map,
-                opml_text,
-                opml_title,
-                opml_category,
-                order_by,
-                include_images
-            )
-
-        if "csv" in output_formats:
-            write_feed_to_csv(
-                all_entries,
-                csv_outfilename,
-                start_date_string_print,
-                end_date_string_print,
-                opml_text,
-                opml_title,
-                opml_category
-            )
-
-        if "json" in output_formats:
-            write_feed_to_json(
-                json_data,
-                all_entries,
-                json_outfilename,
-                current_date_string_print_json,
-                start_date_string_print_json,
-                end_date_string_print_json,
-                opml_text,
-                opml_title,
-                opml_category
-            )
-
-        end_time = time.time()
-
-        print_summary(
-            start_date_print=start_date_string_print,
-            end_date_print=end_date_string_print,
-            opml_filename=opml_filename,
-            entries=all_entries,
-            skipped_entries=skipped_entries,
-            print_retrieved_entries=print_retrieved_entries,
-            print_skipped_entries=print_skipped_entries,
-            html_outfilename=html_outfilename,
-            csv_outfilename=csv_outfilename,
-            json_outfilename=json_outfilename,
-            errors=errors,
-            start_time=start_time,
-            end_time=end_time
+    # Resolve the prefix first so a malformed OPML file fails before any feed is fetched
+    out_filename_prefix = get_output_prefix(opml_filename, cache_folder, ignore_cache)
+
+    all_entries, skipped_entries, icon_map, opml_text, opml_title, opml_category, errors = process_rss_feed(opml_filename, feed_options)
+
+    # Nothing in the time window: skip creating folders and writing empty reports
+    if not all_entries and output_formats:
+        print("No entries to write; skipping report generation.")
+        output_formats = frozenset()
+
+    want_html = "html" in output_formats
+    want_csv = "csv" in output_formats
+    want_json = "json" in output_formats
+
+    html_outfilename = None
+    csv_outfilename = None
+    json_outfilename = None
+    json_data = None
+
+    # Create the needed output folders up front, once each, before any report work
+    for folder in {folder for wanted, folder in ((want_html, html_folder), (want_csv, csv_folder), (want_json, json_folder)) if wanted}:
+        prepare_output_folder(folder)
+
+    # The CSV and HTML writers expect entries in date order: sort once for both.
+    # all_entries keeps its per-feed order for the run summary.
+    report_entries = all_entries
+    if want_html or want_csv:
+        report_entries = sort_posts_by_date(all_entries)
+
+    if want_json or return_raw_json:
+        json_data = convert_feed_to_json_obj(
+            all_entries,
+            current_date_string_print_json,
+            start_date_string_print_json,
+            end_date_string_print_json,
+            opml_text,
+            opml_title,
+            opml_category
         )
 
-    except Exception as e:
-        print(f"Error: {e}")
-        traceback.print_exc()
-        return 1
+    # Each writer only reads report_entries and writes its own file, so they run concurrently
+    report_writers = []
+
+    if want_html:
+        html_outfilename = build_output_path(html_folder, out_filename_prefix, current_date_string_filename_suffix, "html")
+        include_images = user_options["HTML_IMG"].value
+        report_writers.append((write_feed_to_html, (
+            report_entries,
+            html_outfilename,
+            start_date_string_print,
+            end_date_string_print,
+            icon_map,
+            opml_text,
+            opml_title,
+            opml_category,
+            order_by,
+            include_images
+        )))
+
+    if want_csv:
+        csv_outfilename = build_output_path(csv_folder, out_filename_prefix, current_date_string_filename_suffix, "csv")
+        report_writers.append((write_feed_to_csv, (
+            report_entries,
+            csv_outfilename,
+            start_date_string_print,
+            end_date_string_print,
+            opml_text,
+            opml_title,
+            opml_category
+        )))
+
+    if want_json:
+        json_outfilename = build_output_path(json_folder, out_filename_prefix, current_date_string_filename_suffix, "json")
+        report_writers.append((write_feed_to_json, (json_data, json_outfilename)))
+
+    if report_writers:
+        with ThreadPoolExecutor(max_workers=len(report_writers)) as executor:
+            futures = [executor.submit(writer, *writer_args) for writer, writer_args in report_writers]
+            for future in futures:
+                future.result()
+
+    end_time = time.time()
+
+    print_summary(
+        start_date_print=start_date_string_print,
+        end_date_print=end_date_string_print,
+        opml_filename=opml_filename,
+        entries=all_entries,
+        skipped_entries=skipped_entries,
+        print_retrieved_entries=print_retrieved_entries,
+        print_skipped_entries=print_skipped_entries,
+        html_outfilename=html_outfilename,
+        csv_outfilename=csv_outfilename,
+        json_outfilename=json_outfilename,
+        errors=errors,
+        start_time=start_time,
+        end_time=end_time
+    )
 
     if return_raw_json:
         return json_data
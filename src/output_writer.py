@@ -16,15 +16,37 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
 import csv
 import json
 import html
+import functools
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
 
 from .config import (
     TEMPLATE_HTML_FILE, TITLE_KEY, LINK_KEY, DESCRIPTION_KEY, PUBLISHED_DATE_KEY,
-    CHANNEL_IMAGE_KEY, FEED_TITLE_KEY, TEXT_DATE_FORMAT_PRINT_SHORT, TIMEZONE_PRINT, TEXT_DATE_FORMAT_JSON
+    CHANNEL_IMAGE_KEY, FEED_TITLE_KEY, TEXT_DATE_FORMAT_PRINT_SHORT, TIMEZONE_PRINT, TEXT_DATE_FORMAT_JSON,
+    OUTPUT_BUFFER_SIZE
 )
-from .utils import sanitize_for_html, get_website_name
+from .utils import sanitize_for_html, get_website_name, format_datetime
+
+# Sort keys, fetched in C rather than through a Python lambda per entry
+_BY_DATE = itemgetter(PUBLISHED_DATE_KEY)
+_BY_TITLE_DATE = itemgetter(FEED_TITLE_KEY, PUBLISHED_DATE_KEY)
+
+CSV_HEADER = ('Date (UTC)', 'Website', 'Title', 'Description', 'Link')
+
+def sort_posts_by_date(posts):
+    """
+    Returns 'posts' as a new list, oldest first: the order write_feed_to_csv and
+    write_feed_to_html (by date) expect, so one sort serves both writers.
+    """
+    return sorted(posts, key=_BY_DATE)
 
 def convert_feed_to_json_obj(posts, current_date, start_date, end_date, opml_text, opml_title, opml_category):
     """Converts RSS entries to a JSON-serialisable object."""
@@ -33,11 +55,11 @@ def convert_feed_to_json_obj(posts, current_date, start_date, end_date, opml_tex
             {
                 "title": html.unescape(html.unescape(post.get(TITLE_KEY, "").strip())),
                 "link": post.get(LINK_KEY, ""),
-                "published": post[PUBLISHED_DATE_KEY].strftime(TEXT_DATE_FORMAT_JSON),
+                "published": format_datetime(post[PUBLISHED_DATE_KEY], TEXT_DATE_FORMAT_JSON),
                 "source": get_website_name(post[LINK_KEY]),
                 "description": html.unescape(post.get(DESCRIPTION_KEY, "").strip())
             }
-            for post in sorted(posts, key=lambda p: p[PUBLISHED_DATE_KEY], reverse=True)
+            for post in sorted(posts, key=_BY_DATE, reverse=True)
         ]
 
         data = {
@@ -56,61 +78,82 @@ def convert_feed_to_json_obj(posts, current_date, start_date, end_date, opml_tex
         print(f"Error converting feed to JSON object: {e}")
         return None
 
-def write_feed_to_json(data=None, posts=None, output_path=None, current_date=None, start_date=None, end_date=None, opml_text=None, opml_title=None, opml_category=None):
-    """Writes all RSS feed entries to a JSON file."""
-    
+def write_feed_to_json(data, output_path):
+    """
+    Writes a report object built by convert_feed_to_json_obj to a JSON file.
+    'data' is only read, never modified, so this can run alongside the other writers.
+    """
     if data is None:
-        data = convert_feed_to_json_obj(posts, current_date, start_date, end_date, opml_text, opml_title, opml_category)
-        if data is None:
-            return
+        return
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), encoded straight to UTF-8 bytes
+            with open(output_path, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     except Exception as e:
         print(f"Error writing {output_path}: {e}")
 
-def write_feed_to_html(posts_to_print, outfilename, start_date_str, end_date_str, icon_map, opml_text, opml_title, opml_category, order_by, include_images=True):
-    """Writes all RSS feed entries to a HTML file."""
-
-    order_by = order_by.lower() if isinstance(order_by, str) else 'date'
-
-    sorted_posts = []
-    
-    if order_by == 'title_date':
-        sorted_posts = sorted(posts_to_print, key=lambda post: (post[FEED_TITLE_KEY], post[PUBLISHED_DATE_KEY]))
-    else:
-        # Fallback and default
-        sorted_posts = sorted(posts_to_print, key=lambda post: post[PUBLISHED_DATE_KEY])
-
-    table_rows = []
-    for post in sorted_posts:
+@functools.lru_cache(maxsize=4)
+def _read_template(path, mtime_ns, size):
+    with open(path) as file:
+        return file.read()
+
+def load_template(path):
+    """
+    Returns the contents of the HTML template. Cached by path, modification time and size,
+    so repeated reports in one process do not re-read an unchanged template.
+    """
+    st = os.stat(path)
+    return _read_template(path, st.st_mtime_ns, st.st_size)
+
+def _html_rows(posts, icon_map, include_images):
+    """Yields one '<tr>...</tr>' line per post, each built by a single f-string."""
+    for post in posts:
         website_name = sanitize_for_html(html.unescape(get_website_name(post[LINK_KEY])))
         image_url = post.get(CHANNEL_IMAGE_KEY) or (icon_map.get(post[FEED_TITLE_KEY]) if icon_map else "")
         image_html = f"<img src='{sanitize_for_html(html.unescape(image_url))}' alt='{website_name}' class='channel-image'>" if (image_url and include_images) else ""
 
-        published_date_string_print = post[PUBLISHED_DATE_KEY].strftime(TEXT_DATE_FORMAT_PRINT_SHORT)
+        published_date_string_print = format_datetime(post[PUBLISHED_DATE_KEY], TEXT_DATE_FORMAT_PRINT_SHORT)
         title_row = sanitize_for_html(html.unescape(html.unescape(post.get(TITLE_KEY, "")))).strip('"')
         description_row = sanitize_for_html(html.unescape(post[DESCRIPTION_KEY])).strip('"')
         safe_post_link = sanitize_for_html(html.unescape(post[LINK_KEY]))
 
-        row_td = (
-            f"<td>{published_date_string_print}</td>"
+        yield (
+            f"<tr><td>{published_date_string_print}</td>"
             f"<td><b>{website_name}</b></td>"
             f"<td>{image_html}</td>"
             f"<td><a href='{safe_post_link}' target='_blank'>{title_row}</a></td>"
-            f"<td class='italic-cell'>{description_row}</td>"
+            f"<td class='italic-cell'>{description_row}</td></tr>\n"
         )
-        table_rows.append(f"<tr>{row_td}</tr>\n")
+
+def write_feed_to_html(posts_to_print, outfilename, start_date_str, end_date_str, icon_map, opml_text, opml_title, opml_category, order_by, include_images=True):
+    """
+    Writes all RSS feed entries to a HTML file.
+    'posts_to_print' must already be in date order (see sort_posts_by_date); it is only read,
+    so this can run alongside the other writers.
+    """
+
+    order_by = order_by.lower() if isinstance(order_by, str) else 'date'
+
+    if order_by == 'title_date':
+        sorted_posts = sorted(posts_to_print, key=_BY_TITLE_DATE)
+    else:
+        # Fallback and default: the input is already ordered by date
+        sorted_posts = posts_to_print
+
+    rows = "".join(_html_rows(sorted_posts, icon_map, include_images))
 
     try:
-        with open(TEMPLATE_HTML_FILE) as file:
-            template = file.read()
+        template = load_template(TEMPLATE_HTML_FILE)
         html_output = template.format(
             start_date_str=start_date_str,
             end_date_str=end_date_str,
             timezone_print=TIMEZONE_PRINT,
-            rows="".join(table_rows),
+            rows=rows,
             opml_text=opml_text,
             opml_title=opml_title,
             opml_category=opml_category
@@ -120,44 +163,33 @@ def write_feed_to_html(posts_to_print, outfilename, start_date_str, end_date_str
         return
 
     try:
-        with open(outfilename, 'w', encoding='utf-8', newline='') as file:
+        with open(outfilename, 'w', encoding='utf-8', newline='', buffering=OUTPUT_BUFFER_SIZE) as file:
             file.write(html_output)
     except Exception as e:
         print(f"Error writing output file: {e}")
 
 def write_feed_to_csv(posts_to_print, outfilename, start_date_str, end_date_str, opml_text, opml_title, opml_category):
-    """Writes all RSS feed entries to a CSV file."""
-    
-    # Sort posts by published date
-    sorted_posts = sorted(posts_to_print, key=lambda post: post[PUBLISHED_DATE_KEY])
-
-    # Prepare CSV header
-    csv_header = [
-        'Date (UTC)', 'Website', 'Title', 'Description', 'Link'
-    ]
-
-    # Prepare the CSV content
-    csv_rows = []
-    for post in sorted_posts:
-        website_name = get_website_name(post[LINK_KEY])
-        
-        published_date_string_print = post[PUBLISHED_DATE_KEY].strftime(TEXT_DATE_FORMAT_PRINT_SHORT)
-        title_row = sanitize_for_html(post[TITLE_KEY]).strip()  # Strip leading/trailing spaces
-        description_row = sanitize_for_html(post[DESCRIPTION_KEY]).strip()  # Strip leading/trailing spaces
-        safe_post_link = sanitize_for_html(post[LINK_KEY]).strip()  # Strip leading/trailing spaces
-
-        # Add row for CSV
-        csv_rows.append([
-            published_date_string_print,
-            website_name,
-            title_row,
-            description_row,
-            safe_post_link
-        ])
+    """
+    Writes all RSS feed entries to a CSV file.
+    'posts_to_print' must already be in date order (see sort_posts_by_date); it is only read,
+    so this can run alongside the other writers.
+    """
+
+    # Rows are generated lazily and consumed by a single writerows call
+    csv_rows = (
+        (
+            format_datetime(post[PUBLISHED_DATE_KEY], TEXT_DATE_FORMAT_PRINT_SHORT),
+            get_website_name(post[LINK_KEY]),
+            sanitize_for_html(post[TITLE_KEY]).strip(),  # Strip leading/trailing spaces
+            sanitize_for_html(post[DESCRIPTION_KEY]).strip(),
+            sanitize_for_html(post[LINK_KEY]).strip()
+        )
+        for post in posts_to_print
+    )
 
     try:
         # Write to CSV file
-        with open(outfilename, 'w', encoding='utf-8', newline='') as file:
+        with open(outfilename, 'w', encoding='utf-8', newline='', buffering=OUTPUT_BUFFER_SIZE) as file:
             writer = csv.writer(file)
             
             """ # Write metadata
@@ -169,7 +201,7 @@ def write_feed_to_csv(posts_to_print, outfilename, start_date_str, end_date_str,
             # Write the header for the CSV data
             writer.writerow([])  # Blank line before header """
             
-            writer.writerow(csv_header)  # Write header
+            writer.writerow(CSV_HEADER)  # Write header
             writer.writerows(csv_rows)   # Write all rows
     except Exception as e:
         print(f"Error writing CSV output file: {e}")
\ No newline at end of file
@@ -18,27 +18,47 @@
 
 import xml.etree.ElementTree as ET
 import os
+import json
 from datetime import datetime, timezone
 import aiohttp
 import asyncio
 import feedparser
 import re
 import hashlib
+import tempfile
+import calendar
+import functools
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Set
 
-from .utils import get_description, clean_articles, format_title_for_print, get_published_date
+try:
+    import ciso8601
+except ImportError:  # feedparser's own date handlers are used
+    ciso8601 = None
+
+from .utils import get_description, clean_article, format_title_for_print, get_published_date, get_published_timestamp
 from .config import (
     XMLURL_KEY, UPDATED_PARSED_KEY, FEED_URL_KEY, BODY_KEY, OUTLINE_KEY, 
-    TEXT_KEY, TITLE_KEY, LINK_KEY, DESCRIPTION_KEY, PUBLISHED_DATE_KEY, 
-    CHANNEL_IMAGE_KEY, ICON_URL_KEY, IMAGE_KEY, ICON_KEY, FEED_TITLE_KEY,
+    TEXT_KEY, TITLE_KEY, LINK_KEY, ICON_URL_KEY, IMAGE_KEY, ICON_KEY, FEED_TITLE_KEY,
     LOGO_KEY, HREF_KEY, URL_KEY, CATEGORY_KEY, DEFAULT_REQUEST_HEADERS, 
-    HTTP_REQUEST_TIMEOUT, SKIPPED_REASON, MAX_CONCURRENT_TASKS,
-    CACHE_FOLDER, CACHE_MAX_AGE_SECONDS, STALE_DAYS_THRESHOLD
+    HTTP_REQUEST_TIMEOUT, HTTP_LIMIT_PER_HOST, DNS_CACHE_TTL_SECONDS,
+    MAX_CONCURRENT_TASKS,
+    CACHE_FOLDER, CACHE_MAX_AGE_SECONDS, STALE_DAYS_THRESHOLD, OPML_CACHE_FILENAME,
+    ADAPTIVE_REFRESH_FACTOR, ADAPTIVE_REFRESH_MAX_SECONDS, ADAPTIVE_REFRESH_ALPHA
 )
 
-@dataclass
+def _parse_date_ciso8601(date_string):
+    """feedparser date handler for ISO 8601 dates (Atom); other formats raise and fall through."""
+    # Naive timestamps are taken as UTC, as feedparser's W3DTF handler does
+    return ciso8601.parse_datetime(date_string).utctimetuple()
+
+if ciso8601 is not None:
+    feedparser.registerDateHandler(_parse_date_ciso8601)
+
+@dataclass(slots=True, frozen=True)
 class FeedOptions:
     start_date: datetime
     end_date: datetime
@@ -48,11 +68,23 @@ class FeedOptions:
     ignore_cache: bool
     no_conditional_cache: bool
     print_rss_processing_status: bool
+    max_concurrent_tasks: int = MAX_CONCURRENT_TASKS
+    cache_folder: str = CACHE_FOLDER
+    adaptive_refresh: bool = False
+    force_refresh: bool = False
+    # Compiled once from the keyword lists and shared by every feed
+    exclude_pattern: re.Pattern | None = field(init=False, repr=False)
+    aggressive_pattern: re.Pattern | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, "exclude_pattern", compile_keyword_pattern(frozenset(k.lower() for k in self.exclude_keywords or [])))
+        object.__setattr__(self, "aggressive_pattern", compile_keyword_pattern(frozenset(k.lower() for k in self.aggressive_keywords or [])))
 
 def process_rss_feed(opml_filename: str, options: FeedOptions):
     """Handles the RSS feed processing asynchronously via run_feeds."""
     try:
-        feeds, icon_map, opml_text, opml_title, opml_category = read_opml(opml_filename)
+        feeds, icon_map, opml_text, opml_title, opml_category = load_opml(opml_filename, options.cache_folder, options.ignore_cache)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"The OPML file '{opml_filename}' does not exist.") from e
     except ET.ParseError as e:
@@ -94,6 +126,75 @@ def read_opml(file_path):
     
     return feeds, icon_map, opml_text, opml_title, opml_category
 
+def write_file_atomic(path, data):
+    """
+    Writes bytes or text to 'path' through a uniquely named temporary file in the same folder
+    and os.replace, so a reader (or a run interrupted mid-write) never sees a partially written
+    cache file, and concurrent writers of the same path never share a temporary file.
+    """
+    if not isinstance(data, bytes):
+        data = data.encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def load_opml(file_path, cache_folder=CACHE_FOLDER, ignore_cache=False):
+    """
+    Same result as read_opml, but reuses the last parse while the OPML file is unchanged.
+    The parse is cached in memory for the process and, unless ignore_cache is set, on disk
+    (keyed by path and modification time). The feeds are returned as a tuple and the icon
+    map as a read-only mapping, since every caller shares the cached objects.
+    """
+    opml_path = os.path.abspath(file_path)
+    if not os.path.isfile(opml_path):
+        raise FileNotFoundError(f"The OPML file at {file_path} does not exist.")
+    return _load_opml_cached(opml_path, os.stat(opml_path).st_mtime_ns, cache_folder, ignore_cache)
+
+@functools.lru_cache(maxsize=8)
+def _load_opml_cached(opml_path, mtime_ns, cache_folder, ignore_cache):
+    if ignore_cache:
+        return _freeze_opml(*read_opml(opml_path))
+
+    cache_file = os.path.join(cache_folder, OPML_CACHE_FILENAME)
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["path"] == opml_path and cached["mtime_ns"] == mtime_ns:
+            feeds = [tuple(feed) for feed in cached["feeds"]]
+            return _freeze_opml(feeds, cached["icon_map"], cached["text"], cached["title"], cached["category"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    feeds, icon_map, opml_text, opml_title, opml_category = read_opml(opml_path)
+
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        write_file_atomic(cache_file, json.dumps({
+            "path": opml_path,
+            "mtime_ns": mtime_ns,
+            "feeds": feeds,
+            "icon_map": icon_map,
+            "text": opml_text,
+            "title": opml_title,
+            "category": opml_category
+        }))
+    except OSError as e:
+        print(f"Could not write OPML cache {cache_file}: {e}")
+
+    return _freeze_opml(feeds, icon_map, opml_text, opml_title, opml_category)
+
+def _freeze_opml(feeds, icon_map, opml_text, opml_title, opml_category):
+    return tuple(feeds), MappingProxyType(icon_map), opml_text, opml_title, opml_category
+
 def clean_feed_content(content):
     text = content.decode('utf-8', errors='ignore')
     
@@ -159,24 +260,40 @@ def matches_exclude_keywords(text: str, exclude_keywords: set[str], exceptions:
             return keyword
     return None
 
-def process_feed_entries(feed, feed_url, start_date, end_date, exclude_keywords, aggressive_keywords, max_length_description):
-    exclude_keywords_lower = {kw.lower() for kw in exclude_keywords or []}
-    aggressive_keywords_lower = {kw.lower() for kw in aggressive_keywords or []}
+@functools.lru_cache(maxsize=8)
+def compile_keyword_pattern(keywords: frozenset[str]):
+    """
+    Compiles lowercase keywords into a single whole-word alternation.
+    Cached so every feed in a run shares one compiled matcher.
+    Returns None if keywords is empty.
+    """
+    if not keywords:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in sorted(keywords)) + r')\b')
 
-    exclude_pattern = (
-        re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in exclude_keywords_lower) + r')\b')
-        if exclude_keywords_lower else None
-    )
-    aggressive_pattern = (
-        re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in aggressive_keywords_lower) + r')\b')
-        if aggressive_keywords_lower else None
-    )
+def entries_in_window(entries, start_ts, end_ts):
+    """
+    Yields (entry, timestamp) for the entries published within [start_ts, end_ts], in feed order.
+    The timestamp is returned so callers do not have to re-derive the entry's date.
+    """
+    for entry in entries:
+        timestamp = get_published_timestamp(entry)
+        if timestamp is not None and start_ts <= timestamp <= end_ts:
+            yield entry, timestamp
+
+def process_feed_entries(feed, feed_url, start_date, end_date, exclude_pattern, aggressive_pattern, max_length_description):
+    """
+    Splits the entries of a parsed feed published within the window into kept and skipped articles.
+    exclude_pattern / aggressive_pattern are compiled keyword patterns (see compile_keyword_pattern) or None.
+    """
+    # Compare entries as integer epoch seconds; datetimes are only built for entries in the window
+    start_ts = start_date.timestamp()
+    end_ts = end_date.timestamp()
 
     # Channel last updated date
     channel_updated = feed.feed.get(UPDATED_PARSED_KEY)
     if channel_updated:
-        channel_updated_date = datetime(*channel_updated[:6], tzinfo=timezone.utc)
-        if channel_updated_date < start_date:
+        if calendar.timegm(channel_updated[:6]) < start_ts:
             return [], []
 
     # Channel image
@@ -190,10 +307,8 @@ def process_feed_entries(feed, feed_url, start_date, end_date, exclude_keywords,
     recent_articles = []
     skipped_articles = []
 
-    for entry in feed.entries:
-        published_date = get_published_date(entry, fallback_to_now=False)
-        if not published_date or not (start_date <= published_date <= end_date):
-            continue
+    for entry, timestamp in entries_in_window(feed.entries, start_ts, end_ts):
+        published_date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
         title = entry.get(TITLE_KEY, '')
         category = entry.get(CATEGORY_KEY, '')
@@ -216,28 +331,31 @@ def process_feed_entries(feed, feed_url, start_date, end_date, exclude_keywords,
         else:
             matched_keyword = None
 
-        article_data = {
-            FEED_URL_KEY: feed_url,
-            TITLE_KEY: title,
-            LINK_KEY: entry.get(LINK_KEY, ''),
-            DESCRIPTION_KEY: description,
-            PUBLISHED_DATE_KEY: published_date,
-            CHANNEL_IMAGE_KEY: channel_image
-        }
-
         if not aggressive_keyword_found:
-            article_data[SKIPPED_REASON] = "No cybersecurity keyword found"
-            skipped_articles.append(article_data)
+            skipped_reason = "No cybersecurity keyword found"
         elif matched_keyword:
-            article_data[SKIPPED_REASON] = f"Matched keyword: {matched_keyword}"
-            skipped_articles.append(article_data)
+            skipped_reason = f"Matched keyword: {matched_keyword}"
         else:
-            recent_articles.append(article_data)
+            skipped_reason = None
+
+        # Build the final (stripped and truncated) article in one go
+        article_data = clean_article(
+            title or '',
+            entry.get(LINK_KEY, '') or '',
+            description or '',
+            feed_url or '',
+            channel_image or '',
+            published_date,
+            max_length_description,
+            skipped_reason
+        )
 
-    recent_articles_cleaned = clean_articles(recent_articles, max_length_description)
-    skipped_articles_cleaned = clean_articles(skipped_articles, max_length_description)
+        if skipped_reason is None:
+            recent_articles.append(article_data)
+        else:
+            skipped_articles.append(article_data)
 
-    return recent_articles_cleaned, skipped_articles_cleaned
+    return recent_articles, skipped_articles
 
 def handle_asyncio_exception(loop, context):
     msg = context.get("message", "")
@@ -245,15 +363,79 @@ def handle_asyncio_exception(loop, context):
         return
     loop.default_exception_handler(context)
 
-CACHE_DIR = Path(CACHE_FOLDER)
-CACHE_DIR.mkdir(exist_ok=True)
+def create_client_session():
+    """
+    Creates the aiohttp session used to fetch feeds.
+    DEFAULT_REQUEST_HEADERS are set once on the session rather than copied into every request.
+    Connections per host are capped so feeds sharing a server are not hammered,
+    and DNS lookups are cached for the whole run.
+    """
+    return aiohttp.ClientSession(
+        headers=DEFAULT_REQUEST_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
+        connector=aiohttp.TCPConnector(
+            limit_per_host=HTTP_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS
+        )
+    )
+
+def get_cache_stem(cache_folder, feed_url):
+    """Returns the cache path of a feed without extension (.xml, .meta and .rate files share it)."""
+    return Path(cache_folder) / hashlib.md5(feed_url.encode()).hexdigest()
+
+def get_adaptive_max_age(rate_file):
+    """
+    Returns how many seconds a cached copy can be reused without fetching, based on the
+    feed's usual gap between new entries (see update_feed_rate); 0 if not known yet.
+    """
+    try:
+        with open(rate_file, "r", encoding="utf-8") as f:
+            interval = json.load(f)["interval"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0
+    if not interval:
+        return 0
+    return min(interval * ADAPTIVE_REFRESH_FACTOR, ADAPTIVE_REFRESH_MAX_SECONDS)
+
+def update_feed_rate(rate_file, feed):
+    """
+    Records the newest entry time of a freshly fetched feed and keeps an exponentially weighted
+    moving average of the gap between new entries across runs. The first observation is seeded
+    with the average gap between the entries currently in the feed.
+    """
+    timestamps = [ts for ts in map(get_published_timestamp, feed.entries) if ts is not None]
+    if not timestamps:
+        return
+    latest = max(timestamps)
+
+    try:
+        with open(rate_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        previous, interval = state["latest"], state["interval"]
+    except (OSError, ValueError, KeyError, TypeError):
+        previous = None
+        interval = (latest - min(timestamps)) / (len(timestamps) - 1) if len(timestamps) > 1 else None
+
+    if previous is not None:
+        if latest <= previous:
+            return  # nothing new since the last fetch
+        gap = latest - previous
+        interval = gap if not interval else ADAPTIVE_REFRESH_ALPHA * gap + (1 - ADAPTIVE_REFRESH_ALPHA) * interval
+
+    try:
+        write_file_atomic(rate_file, json.dumps({"latest": latest, "interval": interval}))
+    except OSError as e:
+        print(f"Could not write refresh rate {rate_file}: {e}")
 
 async def fetch_feed_with_cache(
     session,
     feed_url,
     ignore_cache,
     no_conditional,
-    max_age_seconds=CACHE_MAX_AGE_SECONDS
+    max_age_seconds=CACHE_MAX_AGE_SECONDS,
+    cache_folder=CACHE_FOLDER,
+    adaptive_refresh=False,
+    force_refresh=False
 ):
     """
     Fetches RSS feed content with optional caching and conditional HTTP requests.
@@ -261,26 +443,34 @@ async def fetch_feed_with_cache(
     Flags:
     - ignore_cache: skip using cache, always fetch remotely.
     - no_conditional: disable If-Modified-Since / ETag headers even if metadata exists.
+    - adaptive_refresh: reuse the cached copy without a request while the feed is not
+      expected to have new entries (see get_adaptive_max_age).
+    - force_refresh: fetch even if the feed's adaptive refresh interval has not elapsed.
+    The cache folder is only created when something is written to it.
     """
-    cache_file = CACHE_DIR / (hashlib.md5(feed_url.encode()).hexdigest() + ".xml")
-    meta_file = CACHE_DIR / (hashlib.md5(feed_url.encode()).hexdigest() + ".meta")
-
-    headers = DEFAULT_REQUEST_HEADERS.copy()
+    cache_stem = get_cache_stem(cache_folder, feed_url)
+    cache_dir = cache_stem.parent
+    cache_file = cache_stem.with_suffix(".xml")
+    meta_file = cache_stem.with_suffix(".meta")
+    rate_file = cache_stem.with_suffix(".rate")
+
+    # Only per-request conditional headers; the defaults come from the session
+    headers = {}
     last_modified = None
     etag = None
 
     # Load metadata if exists
     if meta_file.exists() and not no_conditional:
-        import json
         with open(meta_file, "r", encoding="utf-8") as f:
             meta = json.load(f)
             last_modified = meta.get("last_modified")
             etag = meta.get("etag")
 
-    # Only use cache immediately if ignoring conditional requests
-    if not ignore_cache and no_conditional and cache_file.exists():
-        age = (datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)).seconds
-        if age < max_age_seconds:
+    # Use cache immediately if ignoring conditional requests, or (adaptive refresh only)
+    # if the feed is not expected to have published anything new yet
+    if not ignore_cache and not force_refresh and cache_file.exists():
+        age = (datetime.now() - datetime.fromtimestamp(cache_file.stat().st_mtime)).total_seconds()
+        if (no_conditional and age < max_age_seconds) or (adaptive_refresh and age < get_adaptive_max_age(rate_file)):
             with open(cache_file, "rb") as f:
                 return f.read(), True
 
@@ -303,17 +493,15 @@ async def fetch_feed_with_cache(
 
             # Save cache
             if not ignore_cache:
-                with open(cache_file, "wb") as f:
-                    f.write(content)
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                write_file_atomic(cache_file, content)
                 # Save metadata
                 if not no_conditional:
                     meta = {
                         "last_modified": response.headers.get("Last-Modified"),
                         "etag": response.headers.get("ETag")
                     }
-                    import json
-                    with open(meta_file, "w", encoding="utf-8") as f:
-                        json.dump(meta, f)
+                    write_file_atomic(meta_file, json.dumps(meta))
 
             return content, False
 
@@ -327,9 +515,10 @@ async def fetch_feed_with_cache(
                 return f.read(), True
         raise e
 
-async def retrieve_and_process_feed(session, feedtitle, feed_url, options: FeedOptions):
+async def retrieve_and_process_feed(session, feedtitle, feed_url, options: FeedOptions, parse_executor=None):
     """
     Splits retrieval (with caching) from processing, using unified FeedOptions.
+    If parse_executor is given, feedparser runs there instead of the default thread pool.
     """
     try:
         # Step 1: Retrieval
@@ -337,16 +526,24 @@ async def retrieve_and_process_feed(session, feedtitle, feed_url, options: FeedO
             session,
             feed_url,
             options.ignore_cache,
-            options.no_conditional_cache
+            options.no_conditional_cache,
+            cache_folder=options.cache_folder,
+            adaptive_refresh=options.adaptive_refresh,
+            force_refresh=options.force_refresh
         )
 
         # Step 2: Cleaning + parsing
         cleaned_content = clean_feed_content(raw_content)
-        feed = await asyncio.to_thread(feedparser.parse, cleaned_content)
+        feed = await asyncio.get_running_loop().run_in_executor(
+            parse_executor, feedparser.parse, cleaned_content
+        )
 
         if feed.bozo:
             raise RuntimeError(f"Feed parsing error: {feed.bozo_exception}")
 
+        if options.adaptive_refresh and not is_cached and not options.ignore_cache:
+            update_feed_rate(get_cache_stem(options.cache_folder, feed_url).with_suffix(".rate"), feed)
+
         # Step 3: Processing
         recent_articles, skipped_articles = await asyncio.to_thread(
             process_feed_entries,
@@ -354,8 +551,8 @@ async def retrieve_and_process_feed(session, feedtitle, feed_url, options: FeedO
             feed_url,
             options.start_date,
             options.end_date,
-            set(k.lower() for k in options.exclude_keywords or []),
-            set(k.lower() for k in options.aggressive_keywords or []),
+            options.exclude_pattern,
+            options.aggressive_pattern,
             options.max_length_description,
         )
 
@@ -374,25 +571,26 @@ async def retrieve_and_process_feed(session, feedtitle, feed_url, options: FeedO
         print(f"Error retrieving/processing: {feedtitle} ({feed_url}): {e}")
         return [], [], (feedtitle, feed_url, e)
 
-async def process_all_feeds(feeds, options: FeedOptions, max_concurrent=MAX_CONCURRENT_TASKS):
-    semaphore = asyncio.Semaphore(max_concurrent)
+async def process_all_feeds(feeds, options: FeedOptions):
+    # Fetches are I/O-bound and run concurrently; no point holding more slots than feeds
+    semaphore = asyncio.Semaphore(max(1, min(options.max_concurrent_tasks, len(feeds))))
     all_entries, skipped_entries, errors = [], [], []
 
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
-        connector=aiohttp.TCPConnector()
-    ) as session:
+    # Fetch in parallel, parse serially: a parsed feed is much larger than its raw bytes,
+    # so a single parser thread keeps peak memory flat however many fetches are in flight
+    with ThreadPoolExecutor(max_workers=1) as parse_executor:
+        async with create_client_session() as session:
 
-        async def handle_feed(feedtitle, feed_url):
-            try:
-                async with semaphore:
-                    return await retrieve_and_process_feed(session, feedtitle, feed_url, options)
-            except Exception as e:
-                print(f"Error retrieving/processing: {feedtitle} ({feed_url}): {e}")
-                return [], [], (feedtitle, feed_url, e)
+            async def handle_feed(feedtitle, feed_url):
+                try:
+                    async with semaphore:
+                        return await retrieve_and_process_feed(session, feedtitle, feed_url, options, parse_executor)
+                except Exception as e:
+                    print(f"Error retrieving/processing: {feedtitle} ({feed_url}): {e}")
+                    return [], [], (feedtitle, feed_url, e)
 
-        tasks = [handle_feed(title, url) for title, url in feeds]
-        results = await asyncio.gather(*tasks)
+            tasks = [handle_feed(title, url) for title, url in feeds]
+            results = await asyncio.gather(*tasks)
 
     for recent, skipped, error in results:
         all_entries.extend(recent)
@@ -402,14 +600,14 @@ async def process_all_feeds(feeds, options: FeedOptions, max_concurrent=MAX_CONC
 
     return all_entries, skipped_entries, errors
 
-def check_rss_health(opml_filename: str):
+def check_rss_health(opml_filename: str, cache_folder=CACHE_FOLDER, ignore_cache=False):
     """
     Simple RSS health check: fetches feeds from OPML file,
     prints total items and the date/time of the most recent entry.
     Flags feeds as [STALE!] if the latest entry is older than STALE_DAYS_THRESHOLD.
     """
     try:
-        feeds, icon_map, opml_text, opml_title, opml_category = read_opml(opml_filename)
+        feeds, icon_map, opml_text, opml_title, opml_category = load_opml(opml_filename, cache_folder, ignore_cache)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"The OPML file '{opml_filename}' does not exist.") from e
     except ET.ParseError as e:
@@ -419,10 +617,7 @@ def check_rss_health(opml_filename: str):
     now = datetime.now(timezone.utc)
 
     async def _check():
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
-            connector=aiohttp.TCPConnector()
-        ) as session:
+        async with create_client_session() as session:
             for title, url in feeds:
                 try:
                     content, _ = await fetch_feed_with_cache(session, url, ignore_cache=True, no_conditional=True)
@@ -457,12 +652,7 @@ def check_single_feed(feed_url: str, feed_title: str = None, ignore_cache: bool
     """Fetch a single RSS feed and print titles with dates."""
     
     async def _fetch_and_print():
-        import aiohttp
-
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
-            connector=aiohttp.TCPConnector()
-        ) as session:
+        async with create_client_session() as session:
             raw_content, _ = await fetch_feed_with_cache(
                 session,
                 feed_url,
@@ -23,6 +23,7 @@ from datetime import datetime, timezone
 import re
 import tldextract
 import os
+import functools
 from typing import Any, Dict, Optional
 import yaml
 
@@ -44,6 +45,37 @@ def get_published_date(entry, fallback_to_now=False):
         return datetime.now(timezone.utc)
     return None
 
+def get_published_timestamp(entry):
+    """
+    Returns the entry's published (or updated) time as UTC epoch seconds, or None.
+    Same validation as get_published_date: an out-of-range tuple (e.g. 30 February) is
+    rejected rather than normalised the way calendar.timegm would.
+    """
+    published_date = get_published_date(entry, fallback_to_now=False)
+    if published_date is None:
+        return None
+    return int(published_date.timestamp())
+
+
+# Formats with an equivalent that skips the strftime format interpreter
+_FAST_DATE_FORMATTERS = {
+    "%Y-%m-%d %H:%M:%S": lambda dt: dt.replace(tzinfo=None).isoformat(" ", "seconds"),
+    "%Y-%m-%d_%H-%M-%S": lambda dt: f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}_{dt.hour:02d}-{dt.minute:02d}-{dt.second:02d}",
+    "%Y-%m-%d": lambda dt: dt.date().isoformat(),
+}
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(timestamp, fmt):
+    """Formats a UTC epoch timestamp with strftime, memoising repeated (timestamp, fmt) pairs."""
+    dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    fast_formatter = _FAST_DATE_FORMATTERS.get(fmt)
+    if fast_formatter is not None:
+        return fast_formatter(dt)
+    return dt.strftime(fmt)
+
+def format_datetime(dt, fmt):
+    """Formats an aware datetime via format_timestamp, keyed on whole epoch seconds."""
+    return format_timestamp(int(dt.timestamp()), fmt)
 
 def html_to_plain_text(html_str):
     """Converts HTML to plain text using BeautifulSoup, only if input looks like HTML."""
@@ -91,32 +123,22 @@ def truncate_description(plain_text_description, max_length_description):
         
     return truncated_plain_text_description
 
-def clean_articles(articles: list[dict], max_length_description: int) -> list[dict]:
-    cleaned = []
-    for article in articles:
-        title = article.get(TITLE_KEY, '') or ''
-        link = article.get(LINK_KEY, '') or ''
-        description = article.get(DESCRIPTION_KEY, '') or ''
-        skipped_reason = article.get(SKIPPED_REASON, None)
-        published_date = article.get(PUBLISHED_DATE_KEY)
-        feed_url = article.get(FEED_URL_KEY, '') or ''
-        channel_image = article.get(CHANNEL_IMAGE_KEY, '') or ''
-
-        cleaned_article = {
-            TITLE_KEY: truncate_string(title.strip(), MAX_LENGTH_TITLE),
-            LINK_KEY: truncate_string(link.strip(), MAX_LENGTH_LINK),
-            DESCRIPTION_KEY: truncate_description(description.strip(), max_length_description),
-            FEED_URL_KEY: truncate_string(feed_url.strip(), MAX_LENGTH_FEED_URL),
-            CHANNEL_IMAGE_KEY: truncate_string(channel_image.strip(), MAX_LENGTH_CHANNEL_IMAGE),
-            PUBLISHED_DATE_KEY: published_date  # Keep unmodified
-        }
-
-        if skipped_reason is not None:
-            cleaned_article[SKIPPED_REASON] = truncate_string(skipped_reason.strip(), MAX_LENGTH_SKIPPED_REASON)
-
-        cleaned.append(cleaned_article)
-
-    return cleaned
+def clean_article(title: str, link: str, description: str, feed_url: str, channel_image: str,
+                  published_date, max_length_description: int, skipped_reason: str | None = None) -> dict:
+    """Builds one article dict with every text field stripped and truncated to its maximum length."""
+    cleaned_article = {
+        TITLE_KEY: truncate_string(title.strip(), MAX_LENGTH_TITLE),
+        LINK_KEY: truncate_string(link.strip(), MAX_LENGTH_LINK),
+        DESCRIPTION_KEY: truncate_description(description.strip(), max_length_description),
+        FEED_URL_KEY: truncate_string(feed_url.strip(), MAX_LENGTH_FEED_URL),
+        CHANNEL_IMAGE_KEY: truncate_string(channel_image.strip(), MAX_LENGTH_CHANNEL_IMAGE),
+        PUBLISHED_DATE_KEY: published_date  # Keep unmodified
+    }
+
+    if skipped_reason is not None:
+        cleaned_article[SKIPPED_REASON] = truncate_string(skipped_reason.strip(), MAX_LENGTH_SKIPPED_REASON)
+
+    return cleaned_article
 
 def sanitize_for_html(text):
     """Escapes text for safe HTML display and preserves line breaks."""
@@ -130,30 +152,35 @@ def sanitize_for_csv(text):
         text = '"' + text.replace('"', '""') + '"'
     return text
 
+@functools.lru_cache(maxsize=1024)
+def _registered_domain(host):
+    """Returns domain + suffix for 'host'; cached because most articles share a few sites."""
+    ext = tldextract.extract(host)
+    # domain + suffix forms the registered domain
+    return ext.domain + '.' + ext.suffix
+
 def get_website_name(url):
     try:
-        ext = tldextract.extract(url)
-        # domain + suffix forms the registered domain
-        return ext.domain + '.' + ext.suffix
+        # Key the cache on the host, not the full (per-article) URL; tldextract ignores the
+        # scheme, path, user info and port anyway, so the result is the same
+        return _registered_domain(urlparse(url).netloc or url)
     except Exception as e:
         print(f"Error parsing URL {url}: {e}")
         return "Unknown"
 
-def print_feed_details(feedtitle, feed_url, recent_articles):
-    print(f"\n{FEED_SEPARATOR}")
-    print(f"[{feedtitle}] [{feed_url}]")
+def format_feed_details(feedtitle, feed_url, recent_articles):
+    """Returns the output lines for a feed header followed by its articles."""
+    lines = ["", FEED_SEPARATOR, f"[{feedtitle}] [{feed_url}]"]
     if recent_articles:
-        print(f"{FEED_SEPARATOR}")
-        for article in recent_articles:
-            print_article(article)
-
-    print(f"{FEED_SEPARATOR}")
-
-def print_article(entry):
-    if(not entry[SKIPPED_REASON]):
-        print(f"\t[{entry[TITLE_KEY]}] [{entry[DESCRIPTION_KEY]}] [{entry[LINK_KEY]}] [{entry[PUBLISHED_DATE_KEY]}]")
-    else:
-        print(f"\t[{entry[TITLE_KEY]}] [{entry[DESCRIPTION_KEY]}] [{entry[LINK_KEY]}] [{entry[PUBLISHED_DATE_KEY]}] [{entry[SKIPPED_REASON]}]")
+        lines.append(FEED_SEPARATOR)
+        lines.extend(format_article(article) for article in recent_articles)
+    lines.append(FEED_SEPARATOR)
+    return lines
+
+def format_article(entry):
+    if not entry.get(SKIPPED_REASON):
+        return f"\t[{entry[TITLE_KEY]}] [{entry[DESCRIPTION_KEY]}] [{entry[LINK_KEY]}] [{entry[PUBLISHED_DATE_KEY]}]"
+    return f"\t[{entry[TITLE_KEY]}] [{entry[DESCRIPTION_KEY]}] [{entry[LINK_KEY]}] [{entry[PUBLISHED_DATE_KEY]}] [{entry[SKIPPED_REASON]}]"
 
 def format_title_for_print(title):
     if len(title) > MAX_FEEDTITLE_LEN_PRINT: